@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import os
 import time
+from typing import Iterator
 from uuid import uuid4
 
 import httpx
+import pytest
 
 
 BASE_URL = os.getenv("GATEWAY_BASE_URL", "http://localhost:8000").rstrip("/")
@@ -12,6 +14,14 @@ USER_EMAIL = os.getenv("GATEWAY_TEST_USER_EMAIL", "integration@test.local")
 POLL_TIMEOUT_S = int(os.getenv("GATEWAY_POLL_TIMEOUT_S", "180"))
 
 
+@pytest.fixture(scope="module")
+def client() -> Iterator[httpx.Client]:
+    # One pooled client for the module keeps the connection to the gateway
+    # alive across tests instead of reconnecting for each one.
+    with httpx.Client(timeout=30) as session:
+        yield session
+
+
 def _wait_for_terminal_state(
     client: httpx.Client,
     analysis_id: str,
@@ -53,58 +63,54 @@ def _create_analysis(client: httpx.Client, youtube_url: str, force: bool = False
     return data
 
 
-def test_gateway_health() -> None:
-    with httpx.Client(timeout=30) as client:
-        health = client.get(f"{BASE_URL}/health")
-        health.raise_for_status()
-        payload = health.json()
-        assert payload.get("status") in {"healthy", "degraded"}
-        services = payload.get("services") or {}
-        assert "database" in services
-        assert "redis" in services
-        assert "transcription_service" in services
-        assert "analysis_service" in services
-
-
-def test_create_analysis_idempotency_and_force() -> None:
-    with httpx.Client(timeout=30) as client:
-        youtube_url = f"mock://video/{uuid4()}"
-        first = _create_analysis(client, youtube_url)
-        analysis_id = first.get("analysis_id")
-        assert analysis_id
-
-        same = _create_analysis(client, youtube_url)
-        assert same.get("analysis_id") == analysis_id
-
-        forced = _create_analysis(client, youtube_url, force=True)
-        assert forced.get("analysis_id") != analysis_id
-
-
-def test_get_analysis_not_found() -> None:
-    with httpx.Client(timeout=30) as client:
-        missing = client.get(f"{BASE_URL}/api/v1/analysis/00000000-0000-0000-0000-000000000000")
-        assert missing.status_code == 404
-        payload = missing.json()
-        assert payload.get("detail") == "Analysis not found"
-
-
-def test_analysis_reaches_terminal_state() -> None:
-    with httpx.Client(timeout=30) as client:
-        youtube_url = f"mock://video/{uuid4()}"
-        created = _create_analysis(client, youtube_url, force=True)
-        analysis_id = created.get("analysis_id")
-        assert analysis_id
-
-        result = _wait_for_terminal_state(client, analysis_id)
-        status = result.get("status")
-        assert status in {"completed", "failed"}
-
-        if status == "completed":
-            assert result.get("summary")
-            assert result.get("overall_rating")
-            claims = result.get("claims") or []
-            assert claims
-            for claim in claims:
-                assert claim.get("text")
-                assert claim.get("verdict")
+def test_gateway_health(client: httpx.Client) -> None:
+    health = client.get(f"{BASE_URL}/health")
+    health.raise_for_status()
+    payload = health.json()
+    assert payload.get("status") in {"healthy", "degraded"}
+    services = payload.get("services") or {}
+    assert "database" in services
+    assert "redis" in services
+    assert "transcription_service" in services
+    assert "analysis_service" in services
+
+
+def test_create_analysis_idempotency_and_force(client: httpx.Client) -> None:
+    youtube_url = f"mock://video/{uuid4()}"
+    first = _create_analysis(client, youtube_url)
+    analysis_id = first.get("analysis_id")
+    assert analysis_id
+
+    same = _create_analysis(client, youtube_url)
+    assert same.get("analysis_id") == analysis_id
+
+    forced = _create_analysis(client, youtube_url, force=True)
+    assert forced.get("analysis_id") != analysis_id
+
+
+def test_get_analysis_not_found(client: httpx.Client) -> None:
+    missing = client.get(f"{BASE_URL}/api/v1/analysis/00000000-0000-0000-0000-000000000000")
+    assert missing.status_code == 404
+    payload = missing.json()
+    assert payload.get("detail") == "Analysis not found"
+
+
+def test_analysis_reaches_terminal_state(client: httpx.Client) -> None:
+    youtube_url = f"mock://video/{uuid4()}"
+    created = _create_analysis(client, youtube_url, force=True)
+    analysis_id = created.get("analysis_id")
+    assert analysis_id
+
+    result = _wait_for_terminal_state(client, analysis_id)
+    status = result.get("status")
+    assert status in {"completed", "failed"}
+
+    if status == "completed":
+        assert result.get("summary")
+        assert result.get("overall_rating")
+        claims = result.get("claims") or []
+        assert claims
+        for claim in claims:
+            assert claim.get("text")
+            assert claim.get("verdict")
 
@@ -3,7 +3,8 @@ from __future__ import annotations
 import logging
 import os
 import time
-from typing import List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
 
 from fastapi import FastAPI, HTTPException
 import redis.asyncio as redis
@@ -19,36 +20,45 @@ from .schemas import HealthResponse, ResearchRequest, ResearchResponse, Research
 from .vector_store import CacheStore
 
 
-app = FastAPI(title="Research Service", version="0.1.0")
-configure_logging("research-service")
-app.middleware("http")(observability_middleware)
 logger = logging.getLogger(__name__)
 
 CACHE_TTL_SECONDS = int(os.getenv("RESEARCH_CACHE_TTL_SECONDS", "3600"))
 PUBMED_BASE_URL = os.getenv("PUBMED_BASE_URL", "https://eutils.ncbi.nlm.nih.gov/entrez/eutils")
 PUBMED_API_KEY = os.getenv("PUBMED_API_KEY")
 PUBMED_MAX_RPS = int(os.getenv("PUBMED_MAX_RPS", "8"))
+PUBMED_CACHE_TTL_SECONDS = int(os.getenv("PUBMED_CACHE_TTL_SECONDS", "86400"))
+PUBMED_RATE_LIMIT_BATCH = int(os.getenv("PUBMED_RATE_LIMIT_BATCH", "1"))
 REDIS_URL = os.getenv("REDIS_URL")
 
 if not REDIS_URL:
     raise RuntimeError("REDIS_URL is required for distributed PubMed rate limiting")
 
-cache = CacheStore(ttl_seconds=CACHE_TTL_SECONDS)
-redis_client = redis.from_url(REDIS_URL)
-pubmed_client = PubMedClient(
-    base_url=PUBMED_BASE_URL,
-    api_key=PUBMED_API_KEY,
-    max_rps=PUBMED_MAX_RPS,
-    redis_client=redis_client,
-)
+cache: CacheStore[List[ResearchSource]] = CacheStore(ttl_seconds=CACHE_TTL_SECONDS)
 
 
-@app.on_event("shutdown")
-async def shutdown() -> None:
-    if redis_client is not None:
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    redis_client = redis.from_url(REDIS_URL)
+    try:
+        async with PubMedClient(
+            base_url=PUBMED_BASE_URL,
+            api_key=PUBMED_API_KEY,
+            max_rps=PUBMED_MAX_RPS,
+            redis_client=redis_client,
+            cache_ttl_seconds=PUBMED_CACHE_TTL_SECONDS,
+            rate_limit_batch_size=PUBMED_RATE_LIMIT_BATCH,
+        ) as pubmed_client:
+            app.state.pubmed_client = pubmed_client
+            yield
+    finally:
         await redis_client.close()
 
 
+app = FastAPI(title="Research Service", version="0.1.0", lifespan=lifespan)
+configure_logging("research-service")
+app.middleware("http")(observability_middleware)
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health() -> HealthResponse:
     return HealthResponse(
@@ -66,6 +76,7 @@ async def metrics():
 @app.post("/research", response_model=ResearchResponse)
 async def research(request: ResearchRequest) -> ResearchResponse:
     start = time.perf_counter()
+    pubmed_client: PubMedClient = app.state.pubmed_client
     sources = [source.strip().lower() for source in request.sources]
     unsupported = sorted({source for source in sources if source != "pubmed"})
     if unsupported:
@@ -77,46 +88,43 @@ async def research(request: ResearchRequest) -> ResearchResponse:
     if "pubmed" in sources:
         effective_query = pubmed_client.build_query(request.query)
     cache_key = f"{effective_query}::{','.join(sorted(sources))}::{request.max_results}"
-
-    cached = cache.get(cache_key)
-    if cached:
-        took_ms = int((time.perf_counter() - start) * 1000)
-        return ResearchResponse(
-            query=request.query,
-            results=cached.results,
-            cached=True,
-            took_ms=took_ms,
-            pubmed_requests=cached.pubmed_requests,
-        )
-
-    results: List[ResearchSource] = []
-    pubmed_requests = 0
-    try:
-        if "pubmed" in sources:
-            results.extend(await pubmed_client.search(effective_query, request.max_results))
-            pubmed_requests = 1
-            observe_pubmed_calls(pubmed_requests, endpoint="/research")
-    except Exception as exc:
-        logger.exception(
-            "Research request failed: query=%r sources=%s max_results=%s error_type=%s error=%s",
-            request.query,
-            sources,
-            request.max_results,
-            type(exc).__name__,
-            str(exc),
-        )
-        raise HTTPException(status_code=502, detail=str(exc)) from exc
-
-    results.sort(key=lambda item: item.relevance_score, reverse=True)
-    results = results[: request.max_results]
-
+    pubmed_requests = 1 if "pubmed" in sources else 0
+
+    # Only the results list is cached and shared; each caller's response
+    # carries its own query, timing and cached flag.
+    searched = False
+
+    async def _search() -> List[ResearchSource]:
+        nonlocal searched
+        searched = True
+        results: List[ResearchSource] = []
+        try:
+            if "pubmed" in sources:
+                results.extend(await pubmed_client.search(effective_query, request.max_results))
+                observe_pubmed_calls(pubmed_requests, endpoint="/research")
+        except Exception as exc:
+            logger.exception(
+                "Research request failed: query=%r sources=%s max_results=%s error_type=%s error=%s",
+                request.query,
+                sources,
+                request.max_results,
+                type(exc).__name__,
+                str(exc),
+            )
+            raise HTTPException(status_code=502, detail=str(exc)) from exc
+
+        results.sort(key=lambda item: item.relevance_score, reverse=True)
+        return results[: request.max_results]
+
+    # Concurrent identical requests wait for the same search instead of each
+    # querying PubMed; the results are cached for later repeats.
+    results = await cache.get_or_create(cache_key, _search)
     took_ms = int((time.perf_counter() - start) * 1000)
-    response = ResearchResponse(
+    # The results were validated when first built; skip redoing it.
+    return ResearchResponse.model_construct(
         query=request.query,
         results=results,
-        cached=False,
+        cached=not searched,
         took_ms=took_ms,
         pubmed_requests=pubmed_requests,
     )
-    cache.set(cache_key, response)
-    return response
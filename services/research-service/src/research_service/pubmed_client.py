@@ -1,44 +1,75 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import io
 import logging
+import math
 import re
 import time
-import xml.etree.ElementTree as ET
 from datetime import date
-from typing import List
+from typing import Any, Awaitable, Callable, List
+from urllib.parse import urlencode
 
 import httpx
+import orjson
 import redis.asyncio as redis
+from lxml import etree
 
 from .schemas import ResearchSource
+from .vector_store import CacheStore
 
 
 logger = logging.getLogger(__name__)
 
+_YEAR_RE = re.compile(r"\d{4}")
+
 
 class _RateLimiter:
     def __init__(self, max_rps: int) -> None:
         if max_rps <= 0:
             raise ValueError("max_rps must be > 0")
         self._min_interval = 1.0 / max_rps
-        self._lock = asyncio.Lock()
         self._next_time = 0.0
 
-    async def acquire(self) -> None:
-        async with self._lock:
-            now = time.monotonic()
-            if now < self._next_time:
-                await asyncio.sleep(self._next_time - now)
-                now = time.monotonic()
-            self._next_time = max(now, self._next_time) + self._min_interval
+    async def prepare(self) -> None:
+        return None
+
+    async def acquire(self, count: int = 1) -> float:
+        # Reserving a slot never awaits, so on the single-threaded event loop
+        # it is atomic without a lock; callers under the limit return without
+        # yielding. Concurrent callers sleep until their own slots in parallel.
+        # ``count`` consecutive slots are reserved, but only the first is due
+        # when this returns it; the caller must send the others one interval
+        # apart (see _ReservedSlots), or a one-second window could carry up to
+        # max_rps + count - 1 requests.
+        now = time.monotonic()
+        slot = max(now, self._next_time)
+        self._next_time = slot + self._min_interval * count
+        if slot > now:
+            await asyncio.sleep(slot - now)
+        return slot
+
+    @property
+    def interval(self) -> float:
+        return self._min_interval
+
+    def next_slot(self) -> float:
+        return max(time.monotonic(), self._next_time)
+
+    def defer(self, until: float) -> None:
+        # Hand out no slot before ``until`` (e.g. the start of a span reserved
+        # elsewhere); slots already handed out are unaffected.
+        self._next_time = max(self._next_time, until)
 
 
 class _RedisRateLimiter:
     _RESERVE_SLOT_SCRIPT = """
-    local now_ms = tonumber(ARGV[1])
-    local interval_ms = tonumber(ARGV[2])
-    local ttl_ms = tonumber(ARGV[3])
+    local now = redis.call('TIME')
+    local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+    local interval_ms = tonumber(ARGV[1])
+    local margin_ms = tonumber(ARGV[2])
+    local count = tonumber(ARGV[3])
 
     local current = redis.call('GET', KEYS[1])
     local next_allowed_ms = now_ms
@@ -49,9 +80,11 @@ class _RedisRateLimiter:
       end
     end
 
-    local scheduled_next_ms = next_allowed_ms + interval_ms
-    redis.call('PSETEX', KEYS[1], ttl_ms, tostring(scheduled_next_ms))
-    return next_allowed_ms
+    local scheduled_next_ms = next_allowed_ms + interval_ms * count
+    -- Keep the key until the whole reservation has elapsed; a fixed TTL would
+    -- drop large reservations early and let other replicas reuse their slots.
+    redis.call('PSETEX', KEYS[1], scheduled_next_ms - now_ms + margin_ms, tostring(scheduled_next_ms))
+    return next_allowed_ms - now_ms
     """
 
     def __init__(self, client: redis.Redis, max_rps: int, key_prefix: str = "pubmed:rps") -> None:
@@ -60,39 +93,214 @@ class _RedisRateLimiter:
         self._client = client
         self._max_rps = max_rps
         self._key_prefix = key_prefix
-        self._interval_ms = max(1, int(1000 / max_rps))
-        self._ttl_ms = max(2000, self._interval_ms * max_rps * 4)
+        # Round the spacing up: truncating it (e.g. 333 ms for 3 rps) would let
+        # one extra request into some one-second windows.
+        self._interval_ms = max(1, math.ceil(1000 / max_rps))
+        self._ttl_margin_ms = 2000
+        # EVALSHA with an automatic SCRIPT LOAD on NOSCRIPT, so the Lua body is
+        # not shipped to Redis on every acquire.
+        self._reserve_slot = client.register_script(self._RESERVE_SLOT_SCRIPT)
+
+    async def prepare(self) -> None:
+        # Load the script up front so the first acquire does not pay for a
+        # NOSCRIPT miss followed by SCRIPT LOAD on the request path. This is
+        # only a warm-up: if Redis is not reachable yet, startup continues and
+        # the first acquire loads the script instead.
+        try:
+            await self._client.script_load(self._RESERVE_SLOT_SCRIPT)
+        except redis.RedisError as exc:
+            logger.warning("PubMed rate-limit script preload failed error=%s", str(exc))
+
+    @property
+    def interval(self) -> float:
+        return self._interval_ms / 1000
 
-    async def acquire(self) -> None:
-        now_ms = int(time.time() * 1000)
+    async def reserve(self, count: int = 1) -> float:
+        """Reserve ``count`` consecutive slots and return seconds until the first."""
         key = self._key_prefix
-        allowed_at_ms = await self._client.eval(
-            self._RESERVE_SLOT_SCRIPT,
-            1,
-            key,
-            now_ms,
-            self._interval_ms,
-            self._ttl_ms,
+        # The script reads the Redis server clock and returns how long to wait
+        # for the reserved slot, so replicas with skewed clocks still agree on
+        # the schedule and a single round trip is enough.
+        wait_ms = int(
+            await self._reserve_slot(
+                keys=[key],
+                args=[self._interval_ms, self._ttl_margin_ms, count],
+            )
         )
-        wait_ms = int(allowed_at_ms) - now_ms
-        if wait_ms > 0:
-            await asyncio.sleep(wait_ms / 1000)
+        return max(wait_ms, 0) / 1000
+
+    async def acquire(self, count: int = 1) -> float:
+        wait = await self.reserve(count)
+        slot = time.monotonic() + wait
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return slot
+
+
+class _BatchedRateLimiter:
+    def __init__(
+        self,
+        local: _RateLimiter,
+        remote: _RedisRateLimiter,
+        batch_size: int,
+    ) -> None:
+        if batch_size <= 1:
+            raise ValueError("batch_size must be > 1")
+        self._local = local
+        self._remote = remote
+        self._batch_size = batch_size
+        self._credit = 0
+        self._span_end = 0.0
+        self._refill_lock = asyncio.Lock()
+
+    async def prepare(self) -> None:
+        await self._remote.prepare()
+
+    @property
+    def interval(self) -> float:
+        return self._local.interval
+
+    async def acquire(self, count: int = 1) -> float:
+        # Reserve ``batch_size`` consecutive slots in Redis in one round trip,
+        # then hand them out with local pacing inside the reserved span. Slots
+        # are reserved before they are used and callers needing more wait for
+        # the refill, so replicas never overlap and max_rps holds cluster-wide;
+        # slots left unused when the span ends are dropped.
+        if not self._has_credit(count):
+            async with self._refill_lock:
+                if not self._has_credit(count):
+                    await self._refill(count)
+        self._credit -= count
+        return await self._local.acquire(count)
+
+    def _has_credit(self, count: int) -> bool:
+        last_slot = self._local.next_slot() + self._local.interval * (count - 1)
+        return self._credit >= count and last_slot < self._span_end
+
+    async def _refill(self, count: int) -> None:
+        reserved = max(self._batch_size, count)
+        wait = await self._remote.reserve(reserved)
+        start = time.monotonic() + wait
+        self._local.defer(start)
+        self._credit = reserved
+        self._span_end = start + self._remote.interval * reserved
+
+
+class _ReservedSlots:
+    # Consecutive slots reserved by one acquire(count). Each request takes the
+    # next one, so they go out one limiter interval apart instead of together
+    # at the first slot. The count is decided before the requests run, so a
+    # request that finds none left (e.g. its cache entry expired in between)
+    # acquires its own slot instead of going out unpaced.
+    def __init__(
+        self,
+        limiter: _RateLimiter | _RedisRateLimiter | _BatchedRateLimiter,
+        first: float,
+        count: int,
+    ) -> None:
+        self._limiter = limiter
+        self._next = first
+        self._remaining = count
+
+    async def take(self) -> None:
+        if not self._remaining:
+            await self._limiter.acquire()
+            return
+        self._remaining -= 1
+        slot = self._next
+        self._next += self._limiter.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
 
 
 class PubMedClient:
+    # Open clients pointed at the same endpoint with the same budget share one
+    # limiter, so constructing several clients cannot multiply the rate. The
+    # entry is dropped once the last of them is closed.
+    _limiters: dict[
+        tuple, _RateLimiter | _RedisRateLimiter | _BatchedRateLimiter
+    ] = {}
+    _limiter_users: dict[tuple, int] = {}
+
     def __init__(
         self,
         base_url: str = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils",
         api_key: str | None = None,
         max_rps: int = 10,
         redis_client: redis.Redis | None = None,
+        cache_ttl_seconds: int | None = None,
+        rate_limit_batch_size: int = 1,
     ) -> None:
-        self._base_url = base_url.rstrip("/")
-        self._api_key = api_key
-        if redis_client is None:
-            self._rate_limiter = _RateLimiter(max_rps)
+        base_url = base_url.rstrip("/")
+        # One pooled client per PubMedClient keeps TCP/TLS connections to NCBI
+        # alive across searches. httpx merges client-level params into every
+        # request, so the API key does not have to be copied into each call.
+        # HTTP/2 lets the concurrent ESummary/EFetch pair share one connection;
+        # with brotli installed httpx also advertises br for smaller payloads.
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=True,
+            timeout=20,
+            params={"api_key": api_key} if api_key else None,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60,
+            ),
+        )
+        # E-utilities responses for the same params rarely change, so repeats
+        # (e.g. the same ids found by different queries) skip the network and
+        # do not consume a rate-limit slot. Only the parsed summary rows and
+        # abstracts are kept, not the raw payloads, and the entry count is
+        # bounded. A TTL of 0 keeps only the coalescing of identical in-flight
+        # requests.
+        self._cache: CacheStore[Any] = CacheStore(
+            ttl_seconds=cache_ttl_seconds or 0, maxsize=2_000
+        )
+        # The batch size only changes how slots are reserved, not the budget,
+        # so it is not part of the key; the first client's setting is used.
+        # Limiters hold loop-bound asyncio primitives, so clients running on
+        # different event loops (app restarts, test loops) never share one.
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        limiter_key = (base_url, max_rps, redis_client, loop)
+        rate_limiter = self._limiters.get(limiter_key)
+        if rate_limiter is None:
+            if redis_client is None:
+                rate_limiter = _RateLimiter(max_rps)
+            elif rate_limit_batch_size > 1:
+                rate_limiter = _BatchedRateLimiter(
+                    _RateLimiter(max_rps),
+                    _RedisRateLimiter(redis_client, max_rps),
+                    rate_limit_batch_size,
+                )
+            else:
+                rate_limiter = _RedisRateLimiter(redis_client, max_rps)
+            self._limiters[limiter_key] = rate_limiter
+        self._limiter_users[limiter_key] = self._limiter_users.get(limiter_key, 0) + 1
+        self._limiter_key: tuple | None = limiter_key
+        self._rate_limiter = rate_limiter
+
+    async def __aenter__(self) -> PubMedClient:
+        await self._rate_limiter.prepare()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+        limiter_key, self._limiter_key = self._limiter_key, None
+        if limiter_key is None:
+            return
+        users = self._limiter_users.pop(limiter_key) - 1
+        if users:
+            self._limiter_users[limiter_key] = users
         else:
-            self._rate_limiter = _RedisRateLimiter(redis_client, max_rps)
+            del self._limiters[limiter_key]
 
     def build_query(self, query: str) -> str:
         # start_year = date.today().year - 10
@@ -124,129 +332,174 @@ class PubMedClient:
         return data.get("esearchresult", {}).get("idlist", [])
 
     async def _esummary(self, ids: List[str]) -> List[ResearchSource]:
+        # Both requests (and their cache keys) use the same id list; join it once.
+        id_param = ",".join(ids)
         params = {
             "db": "pubmed",
             "retmode": "json",
-            "id": ",".join(ids),
+            "id": id_param,
         }
-        data = await self._get("esummary.fcgi", params)
-        abstracts = await self._efetch_abstracts(ids)
+        efetch_params = _efetch_params(id_param)
+        # ESummary and EFetch only depend on the ids, so reserve the rate-limit
+        # slots for both (minus cache hits) in one acquire and run the requests
+        # concurrently, each at its own slot.
+        uncached = sum(
+            not self._is_cached(path, request_params)
+            for path, request_params in (
+                ("esummary.fcgi", params),
+                ("efetch.fcgi", efetch_params),
+            )
+        )
+        first = await self._rate_limiter.acquire(uncached) if uncached else 0.0
+        slots = _ReservedSlots(self._rate_limiter, first, uncached)
+        rows, abstracts = await asyncio.gather(
+            self._single_flight(
+                "esummary.fcgi", params, self._fetch_summary_rows, slots
+            ),
+            self._efetch_abstracts(efetch_params, slots),
+        )
 
+        # Every field is already normalized above, so skip re-validating it.
         results: List[ResearchSource] = []
-        summary = data.get("result", {})
-        for pubmed_id in ids:
-            item = summary.get(pubmed_id)
-            if not item:
-                continue
+        for pubmed_id, title, pubdate, pubtype, elocationid in rows:
             results.append(
-                ResearchSource(
-                    title=item.get("title") or "Untitled result",
+                ResearchSource.model_construct(
+                    title=title or "Untitled result",
                     url=f"https://pubmed.ncbi.nlm.nih.gov/{pubmed_id}/",
                     source_type="pubmed",
-                    publication_date=_parse_pubdate(item.get("pubdate")),
-                    publication_type=_coerce_pubtypes(item.get("pubtype")),
+                    publication_date=_parse_pubdate(pubdate),
+                    publication_type=_coerce_pubtypes(pubtype),
                     relevance_score=1.0,
-                    snippet=abstracts.get(pubmed_id) or item.get("elocationid"),
+                    snippet=abstracts.get(pubmed_id) or elocationid,
                 )
             )
         return results
 
-    async def _efetch_abstracts(self, ids: List[str]) -> dict[str, str]:
-        if not ids:
-            return {}
-        params = {
-            "db": "pubmed",
-            "retmode": "xml",
-            "rettype": "abstract",
-            "id": ",".join(ids),
-        }
+    async def _efetch_abstracts(
+        self, params: dict[str, str], slots: _ReservedSlots | None = None
+    ) -> dict[str, str]:
         try:
-            xml_text = await self._get_text("efetch.fcgi", params)
+            return await self._single_flight(
+                "efetch.fcgi", params, self._fetch_abstracts, slots
+            )
         except httpx.HTTPStatusError as exc:
             if exc.response.status_code == 404:
                 return {}
             raise
-        return _parse_abstracts_from_xml(xml_text)
 
     async def _get(self, path: str, params: dict[str, str]) -> dict:
-        request_params = dict(params)
-        if self._api_key:
-            request_params["api_key"] = self._api_key
-
-        await self._rate_limiter.acquire()
-        async with httpx.AsyncClient(timeout=20) as client:
-            try:
-                response = await client.get(f"{self._base_url}/{path}", params=request_params)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as exc:
-                retry_after = exc.response.headers.get("Retry-After")
-                logger.warning(
-                    "PubMed HTTP error path=%s status=%s retry_after=%s term=%r body=%r",
-                    path,
-                    exc.response.status_code,
-                    retry_after,
-                    request_params.get("term"),
-                    _truncate(exc.response.text),
-                )
-                raise
-            except httpx.TimeoutException as exc:
-                logger.warning(
-                    "PubMed timeout path=%s term=%r error=%s",
-                    path,
-                    request_params.get("term"),
-                    str(exc),
-                )
-                raise
-            except httpx.RequestError as exc:
-                logger.warning(
-                    "PubMed request error path=%s term=%r error_type=%s error=%s",
-                    path,
-                    request_params.get("term"),
-                    type(exc).__name__,
-                    str(exc),
-                )
-                raise
-
-    async def _get_text(self, path: str, params: dict[str, str]) -> str:
-        request_params = dict(params)
-        if self._api_key:
-            request_params["api_key"] = self._api_key
-
-        await self._rate_limiter.acquire()
-        async with httpx.AsyncClient(timeout=20) as client:
-            try:
-                response = await client.get(f"{self._base_url}/{path}", params=request_params)
-                response.raise_for_status()
-                return response.text
-            except httpx.HTTPStatusError as exc:
-                retry_after = exc.response.headers.get("Retry-After")
-                logger.warning(
-                    "PubMed HTTP error path=%s status=%s retry_after=%s ids=%r body=%r",
-                    path,
-                    exc.response.status_code,
-                    retry_after,
-                    request_params.get("id"),
-                    _truncate(exc.response.text),
-                )
-                raise
-            except httpx.TimeoutException as exc:
-                logger.warning(
-                    "PubMed timeout path=%s ids=%r error=%s",
-                    path,
-                    request_params.get("id"),
-                    str(exc),
-                )
-                raise
-            except httpx.RequestError as exc:
-                logger.warning(
-                    "PubMed request error path=%s ids=%r error_type=%s error=%s",
-                    path,
-                    request_params.get("id"),
-                    type(exc).__name__,
-                    str(exc),
-                )
-                raise
+        return await self._single_flight(path, params, self._fetch_json)
+
+    async def _single_flight(
+        self,
+        path: str,
+        params: dict[str, str],
+        fetch: Callable[[str, dict[str, str]], Awaitable[Any]],
+        slots: _ReservedSlots | None = None,
+    ) -> Any:
+        # Identical concurrent lookups (e.g. the same claim researched by
+        # parallel analyses) share a single upstream request.
+        return await self._cache.get_or_create(
+            _cache_key(path, params),
+            lambda: self._rate_limited(path, params, fetch, slots),
+        )
+
+    def _is_cached(self, path: str, params: dict[str, str]) -> bool:
+        return self._cache.get(_cache_key(path, params)) is not None
+
+    async def _rate_limited(
+        self,
+        path: str,
+        params: dict[str, str],
+        fetch: Callable[[str, dict[str, str]], Awaitable[Any]],
+        slots: _ReservedSlots | None,
+    ) -> Any:
+        if slots is None:
+            await self._rate_limiter.acquire()
+        else:
+            await slots.take()
+        return await fetch(path, params)
+
+    async def _fetch_json(self, path: str, params: dict[str, str]) -> dict:
+        try:
+            response = await self._client.get(path, params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as exc:
+            retry_after = exc.response.headers.get("Retry-After")
+            logger.warning(
+                "PubMed HTTP error path=%s status=%s retry_after=%s term=%r body=%r",
+                path,
+                exc.response.status_code,
+                retry_after,
+                params.get("term"),
+                _truncate(exc.response.text),
+            )
+            raise
+        except httpx.TimeoutException as exc:
+            logger.warning(
+                "PubMed timeout path=%s term=%r error=%s",
+                path,
+                params.get("term"),
+                str(exc),
+            )
+            raise
+        except httpx.RequestError as exc:
+            logger.warning(
+                "PubMed request error path=%s term=%r error_type=%s error=%s",
+                path,
+                params.get("term"),
+                type(exc).__name__,
+                str(exc),
+            )
+            raise
+
+    async def _fetch_summary_rows(
+        self, path: str, params: dict[str, str]
+    ) -> List[tuple]:
+        data = await self._fetch_json(path, params)
+        return _summary_rows(data, params["id"].split(","))
+
+    async def _fetch_abstracts(
+        self, path: str, params: dict[str, str]
+    ) -> dict[str, str]:
+        xml_bytes = await self._fetch_bytes(path, params)
+        # XML parsing is CPU-bound; keep it off the event loop.
+        return await asyncio.to_thread(_parse_abstracts_from_xml, xml_bytes)
+
+    async def _fetch_bytes(self, path: str, params: dict[str, str]) -> bytes:
+        try:
+            response = await self._client.get(path, params=params)
+            response.raise_for_status()
+            return response.content
+        except httpx.HTTPStatusError as exc:
+            retry_after = exc.response.headers.get("Retry-After")
+            logger.warning(
+                "PubMed HTTP error path=%s status=%s retry_after=%s ids=%r body=%r",
+                path,
+                exc.response.status_code,
+                retry_after,
+                params.get("id"),
+                _truncate(exc.response.text),
+            )
+            raise
+        except httpx.TimeoutException as exc:
+            logger.warning(
+                "PubMed timeout path=%s ids=%r error=%s",
+                path,
+                params.get("id"),
+                str(exc),
+            )
+            raise
+        except httpx.RequestError as exc:
+            logger.warning(
+                "PubMed request error path=%s ids=%r error_type=%s error=%s",
+                path,
+                params.get("id"),
+                type(exc).__name__,
+                str(exc),
+            )
+            raise
 
 
 def _truncate(value: str, limit: int = 500) -> str:
@@ -255,43 +508,90 @@ def _truncate(value: str, limit: int = 500) -> str:
     return f"{value[:limit]}...<truncated>"
 
 
+def _cache_key(path: str, params: dict[str, str]) -> str:
+    return f"{path}?{urlencode(sorted(params.items()))}"
+
+
+def _efetch_params(id_param: str) -> dict[str, str]:
+    return {
+        "db": "pubmed",
+        "retmode": "xml",
+        "rettype": "abstract",
+        "id": id_param,
+    }
+
+
+def _summary_rows(data: dict, ids: List[str]) -> List[tuple]:
+    summary = data.get("result", {})
+    rows = []
+    for pubmed_id in ids:
+        item = summary.get(pubmed_id)
+        if not item:
+            continue
+        rows.append(
+            (
+                pubmed_id,
+                item.get("title"),
+                item.get("pubdate"),
+                item.get("pubtype"),
+                item.get("elocationid"),
+            )
+        )
+    return rows
+
+
 def _parse_pubdate(value: str | None) -> date | None:
     if not value:
         return None
-    match = re.search(r"\d{4}", value)
+    # ESummary pubdates almost always lead with the year ("2023 Mar 15").
+    if len(value) >= 4 and value[:4].isdecimal():
+        return _year_start(int(value[:4]))
+    match = _YEAR_RE.search(value)
     if not match:
         return None
-    year = int(match.group(0))
+    return _year_start(int(match.group(0)))
+
+
+@functools.lru_cache(maxsize=256)
+def _year_start(year: int) -> date:
+    # A batch of results spans only a handful of years, and dates are
+    # immutable, so one instance per year can be shared.
     return date(year, 1, 1)
 
 
 def _coerce_pubtypes(value: object) -> List[str] | None:
+    # ESummary returns a list of strings; check that shape first and strip
+    # each entry only once.
+    if isinstance(value, list):
+        cleaned = [text for text in (item.strip() for item in value if isinstance(item, str)) if text]
+        return cleaned or None
     if isinstance(value, str):
         cleaned = value.strip()
         return [cleaned] if cleaned else None
-    if isinstance(value, list):
-        cleaned = [item.strip() for item in value if isinstance(item, str) and item.strip()]
-        return cleaned or None
     return None
 
 
-def _parse_abstracts_from_xml(xml_text: str) -> dict[str, str]:
+def _parse_abstracts_from_xml(xml_bytes: bytes) -> dict[str, str]:
+    results: dict[str, str] = {}
+    # Stream article by article and drop each one once processed so memory
+    # stays bounded by a single PubmedArticle instead of the whole document.
+    context = etree.iterparse(io.BytesIO(xml_bytes), events=("end",), tag="PubmedArticle")
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError:
+        for _, article in context:
+            pmid_elem = article.find(".//PMID")
+            if pmid_elem is not None and pmid_elem.text:
+                abstract_texts = []
+                for node in article.iterfind(".//Abstract/AbstractText"):
+                    text = "".join(node.itertext()).strip()
+                    if text:
+                        abstract_texts.append(text)
+                if abstract_texts:
+                    results[pmid_elem.text.strip()] = "\n".join(abstract_texts)
+            article.clear()
+            while article.getprevious() is not None:
+                del article.getparent()[0]
+    except etree.XMLSyntaxError:
+        # A truncated or malformed payload yields no abstracts rather than a
+        # partial set that would then be cached for the full TTL.
         return {}
-
-    results: dict[str, str] = {}
-    for article in root.findall(".//PubmedArticle"):
-        pmid_elem = article.find(".//PMID")
-        if pmid_elem is None or not pmid_elem.text:
-            continue
-        pmid = pmid_elem.text.strip()
-        abstract_texts = []
-        for node in article.findall(".//Abstract/AbstractText"):
-            text = "".join(node.itertext()).strip()
-            if text:
-                abstract_texts.append(text)
-        if abstract_texts:
-            results[pmid] = "\n".join(abstract_texts)
     return results
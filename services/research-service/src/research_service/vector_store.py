@@ -1,33 +1,82 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
 import time
-from typing import Dict, Tuple
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Generic, List, Tuple, TypeVar
 
-from .schemas import ResearchResponse
 
+T = TypeVar("T")
 
-class CacheStore:
-    def __init__(self, ttl_seconds: int) -> None:
+
+class CacheStore(Generic[T]):
+    def __init__(self, ttl_seconds: int, maxsize: int = 10_000) -> None:
         self._ttl_seconds = ttl_seconds
-        self._store: Dict[str, Tuple[float, ResearchResponse]] = {}
+        self._maxsize = maxsize
+        # Least recently used entries sit at the front and are evicted first
+        # once the store is full, so memory stays bounded under varied queries.
+        self._store: OrderedDict[str, Tuple[float, T]] = OrderedDict()
+        # (expires_at, key) min-heap so expired entries are dropped even if
+        # they are never read again.
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     @property
     def ttl_seconds(self) -> int:
         return self._ttl_seconds
 
-    def get(self, key: str) -> ResearchResponse | None:
+    def get(self, key: str) -> T | None:
         entry = self._store.get(key)
         if not entry:
             return None
         expires_at, value = entry
-        if time.time() > expires_at:
+        if time.monotonic() > expires_at:
             self._store.pop(key, None)
             return None
+        self._store.move_to_end(key)
         return value
 
-    def set(self, key: str, value: ResearchResponse) -> None:
-        expires_at = time.time() + self._ttl_seconds
+    def set(self, key: str, value: T) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        now = time.monotonic()
+        expires_at = now + self._ttl_seconds
         self._store[key] = (expires_at, value)
+        self._store.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        self._sweep(now)
+        while len(self._store) > self._maxsize:
+            self._store.popitem(last=False)
+
+    def _sweep(self, now: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._store.get(key)
+            # Skip heap entries left behind by overwrites or LRU eviction.
+            if entry is not None and entry[0] == expires_at:
+                del self._store[key]
+        if len(heap) > 2 * self._maxsize:
+            self._expiry_heap = [(entry[0], key) for key, entry in self._store.items()]
+            heapq.heapify(self._expiry_heap)
+
+    async def get_or_create(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        # Concurrent misses for the same key share one factory call.
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is None:
+            self.set(key, task.result())
 
     def size(self) -> int:
         return len(self._store)
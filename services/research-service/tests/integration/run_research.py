@@ -1,33 +1,37 @@
 #!/usr/bin/env python3
-import json
+import atexit
 import os
 import sys
-import urllib.request
 
+import httpx
 
-def http_get_json(url: str):
-    req = urllib.request.Request(url, method="GET")
+
+_session = httpx.Client(
+    base_url=os.environ.get("RESEARCH_BASE_URL", "http://localhost:8003"),
+    timeout=60,
+)
+atexit.register(_session.close)
+
+
+def http_get_json(path: str):
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode("utf-8"))
+        response = _session.get(path, timeout=30)
+        response.raise_for_status()
+        return response.json()
     except Exception as exc:
         raise RuntimeError(f"request failed: {exc}") from exc
 
 
-def http_post_json(url: str, payload: dict):
-    data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        url, data=data, headers={"Content-Type": "application/json"}, method="POST"
-    )
+def http_post_json(path: str, payload: dict):
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read().decode("utf-8"))
+        response = _session.post(path, json=payload)
+        response.raise_for_status()
+        return response.json()
     except Exception as exc:
         raise RuntimeError(f"request failed: {exc}") from exc
 
 
 def main() -> int:
-    base_url = os.environ.get("RESEARCH_BASE_URL", "http://localhost:8003")
     require_real = os.environ.get("RESEARCH_REQUIRE_REAL", "0")
 
     payload = {
@@ -37,7 +41,7 @@ def main() -> int:
     }
 
     try:
-        response = http_post_json(f"{base_url}/research", payload)
+        response = http_post_json("/research", payload)
     except RuntimeError as exc:
         if require_real == "1":
             sys.exit(str(exc))
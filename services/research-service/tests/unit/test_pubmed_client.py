@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+
+import pytest
+import redis.asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+
+from research_service.pubmed_client import (
+    PubMedClient,
+    _BatchedRateLimiter,
+    _RateLimiter,
+    _RedisRateLimiter,
+    _ReservedSlots,
+    _parse_abstracts_from_xml,
+)
+
+
+def test_parse_abstracts_from_xml_joins_sections_per_article():
+    xml = b"""<?xml version="1.0" ?>
+<PubmedArticleSet>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID Version="1">111</PMID>
+      <Article><Abstract>
+        <AbstractText Label="BACKGROUND">Creatine <i>improves</i> strength.</AbstractText>
+        <AbstractText Label="RESULTS">Effect was small.</AbstractText>
+      </Abstract></Article>
+    </MedlineCitation>
+  </PubmedArticle>
+  <PubmedArticle>
+    <MedlineCitation><PMID Version="1">222</PMID></MedlineCitation>
+  </PubmedArticle>
+</PubmedArticleSet>
+"""
+    assert _parse_abstracts_from_xml(xml) == {
+        "111": "Creatine improves strength.\nEffect was small.",
+    }
+
+
+def test_parse_abstracts_from_xml_handles_invalid_payload():
+    assert _parse_abstracts_from_xml(b"") == {}
+    assert _parse_abstracts_from_xml(b"<PubmedArticleSet><PubmedArticle>") == {}
+    truncated = b"""<PubmedArticleSet><PubmedArticle><MedlineCitation>
+<PMID>1</PMID><Article><Abstract><AbstractText>Text.</AbstractText></Abstract></Article>
+</MedlineCitation></PubmedArticle><PubmedArticle>"""
+    assert _parse_abstracts_from_xml(truncated) == {}
+
+
+def test_identical_concurrent_requests_share_one_fetch():
+    calls: list[str] = []
+
+    async def _fake_fetch(path, params):
+        calls.append(path)
+        await asyncio.sleep(0.01)
+        return {"esearchresult": {"idlist": ["1"]}}
+
+    async def _run():
+        client = PubMedClient()
+        client._fetch_json = _fake_fetch
+        try:
+            return await asyncio.gather(
+                *(client._get("esearch.fcgi", {"term": "creatine"}) for _ in range(3))
+            )
+        finally:
+            await client.aclose()
+
+    results = asyncio.run(_run())
+    assert calls == ["esearch.fcgi"]
+    assert all(result == {"esearchresult": {"idlist": ["1"]}} for result in results)
+
+
+def test_cached_response_skips_fetch():
+    calls: list[str] = []
+
+    async def _fake_fetch(path, params):
+        calls.append(path)
+        return {"result": {}}
+
+    async def _run():
+        client = PubMedClient(cache_ttl_seconds=60)
+        client._fetch_json = _fake_fetch
+        try:
+            first = await client._get("esummary.fcgi", {"id": "1,2"})
+            second = await client._get("esummary.fcgi", {"id": "1,2"})
+            return first, second
+        finally:
+            await client.aclose()
+
+    first, second = asyncio.run(_run())
+    assert calls == ["esummary.fcgi"]
+    assert first is second
+
+
+def test_summary_lookup_caches_parsed_rows_and_abstracts():
+    calls: list[str] = []
+
+    async def _fake_json(path, params):
+        calls.append(path)
+        return {"result": {"1": {"title": "Creatine", "pubdate": "2020 Jan", "authors": ["A"]}}}
+
+    async def _fake_bytes(path, params):
+        calls.append(path)
+        return b"""<PubmedArticleSet><PubmedArticle><MedlineCitation>
+<PMID>1</PMID><Article><Abstract><AbstractText>Text.</AbstractText></Abstract></Article>
+</MedlineCitation></PubmedArticle></PubmedArticleSet>"""
+
+    async def _run():
+        client = PubMedClient(cache_ttl_seconds=60)
+        client._fetch_json = _fake_json
+        client._fetch_bytes = _fake_bytes
+        try:
+            first = await client._esummary(["1"])
+            second = await client._esummary(["1"])
+            return first, second, list(client._cache._store.values())
+        finally:
+            await client.aclose()
+
+    first, second, cached = asyncio.run(_run())
+    assert sorted(calls) == ["efetch.fcgi", "esummary.fcgi"]
+    assert first == second
+    assert first[0].snippet == "Text."
+    values = sorted((value for _, value in cached), key=lambda value: type(value).__name__)
+    assert values == [{"1": "Text."}, [("1", "Creatine", "2020 Jan", None, None)]]
+
+
+def test_summary_and_abstract_requests_take_consecutive_slots():
+    sent: list[float] = []
+
+    async def _fake_json(path, params):
+        sent.append(time.monotonic())
+        return {"result": {}}
+
+    async def _fake_bytes(path, params):
+        sent.append(time.monotonic())
+        return b"<PubmedArticleSet/>"
+
+    async def _run():
+        client = PubMedClient(max_rps=10)
+        client._fetch_json = _fake_json
+        client._fetch_bytes = _fake_bytes
+        try:
+            await client._esummary(["1"])
+        finally:
+            await client.aclose()
+
+    asyncio.run(_run())
+    sent.sort()
+    # One acquire reserves both slots, but the second request still waits one
+    # interval so no one-second window exceeds max_rps.
+    assert sent[1] - sent[0] == pytest.approx(0.1, abs=0.03)
+
+
+def test_request_beyond_the_reserved_count_acquires_its_own_slot():
+    limiter = _RateLimiter(max_rps=20)
+    sent: list[float] = []
+
+    async def _request(take):
+        await take()
+        sent.append(time.monotonic())
+
+    async def _run():
+        slots = _ReservedSlots(limiter, await limiter.acquire(1), 1)
+        # An unrelated caller takes the slot right after the reservation, so
+        # the extra request must not reuse it.
+        await asyncio.gather(
+            _request(slots.take), _request(limiter.acquire), _request(slots.take)
+        )
+
+    asyncio.run(_run())
+    sent.sort()
+    assert sent[1] - sent[0] == pytest.approx(0.05, abs=0.02)
+    assert sent[2] - sent[1] == pytest.approx(0.05, abs=0.02)
+
+
+class _SharedSchedule:
+    """In-process stand-in for the Redis slot script shared by replicas."""
+
+    def __init__(self, max_rps: int) -> None:
+        self._interval_ms = max(1, math.ceil(1000 / max_rps))
+        self._next_ms = 0.0
+
+    @property
+    def interval(self) -> float:
+        return self._interval_ms / 1000
+
+    async def prepare(self) -> None:
+        return None
+
+    async def reserve(self, count: int = 1) -> float:
+        await asyncio.sleep(0.002)
+        now_ms = time.monotonic() * 1000
+        slot_ms = max(now_ms, self._next_ms)
+        self._next_ms = slot_ms + self._interval_ms * count
+        return (slot_ms - now_ms) / 1000
+
+
+def test_batched_limiters_keep_cluster_rate_under_concurrency():
+    max_rps = 100
+    requests_per_replica = 30
+    schedule = _SharedSchedule(max_rps)
+    replicas = [
+        _BatchedRateLimiter(_RateLimiter(max_rps), schedule, batch_size=4)
+        for _ in range(2)
+    ]
+    granted: list[float] = []
+
+    async def _request(limiter):
+        await limiter.acquire()
+        granted.append(time.monotonic())
+
+    async def _run():
+        await asyncio.gather(
+            *(
+                _request(limiter)
+                for limiter in replicas
+                for _ in range(requests_per_replica)
+            )
+        )
+
+    asyncio.run(_run())
+    granted.sort()
+    # Both replicas draw from one schedule, so 60 requests at 100 rps span at
+    # least 59 intervals; pacing each replica on its own would take half that.
+    assert granted[-1] - granted[0] >= (len(granted) - 1) / max_rps * 0.95
+
+
+def test_redis_reservation_key_outlives_the_reserved_span():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+
+    async def _run():
+        client = fakeredis.FakeAsyncRedis()
+        limiter = _RedisRateLimiter(client, max_rps=10)
+        try:
+            assert await limiter.reserve(100) == 0
+            return await client.pttl("pubmed:rps")
+        finally:
+            await client.aclose()
+
+    # 100 slots at 10 rps are reserved for 10 s; the key must not expire first.
+    assert asyncio.run(_run()) > 10_000
+
+
+def test_redis_script_preload_tolerates_unavailable_redis():
+    async def _run():
+        client = redis.Redis(
+            host="127.0.0.1", port=1, socket_connect_timeout=0.1, retry=Retry(NoBackoff(), 0)
+        )
+        try:
+            await _RedisRateLimiter(client, max_rps=10).prepare()
+        finally:
+            await client.aclose()
+
+    asyncio.run(_run())
+
+
+def test_open_clients_share_a_limiter_until_the_last_closes():
+    async def _run():
+        first = PubMedClient(base_url="https://example.test", rate_limit_batch_size=1)
+        second = PubMedClient(base_url="https://example.test", rate_limit_batch_size=4)
+        shared = first._rate_limiter is second._rate_limiter
+        await first.aclose()
+        await first.aclose()
+        still_registered = second._limiter_key in PubMedClient._limiters
+        await second.aclose()
+        return shared, still_registered, PubMedClient._limiters, PubMedClient._limiter_users
+
+    shared, still_registered, limiters, users = asyncio.run(_run())
+    assert shared
+    assert still_registered
+    assert limiters == {}
+    assert users == {}
+
+
+def test_rate_limiter_spaces_slots_by_reserved_count():
+    limiter = _RateLimiter(max_rps=20)
+    granted: list[float] = []
+
+    async def _request(count):
+        await limiter.acquire(count)
+        granted.append(time.monotonic())
+
+    async def _run():
+        await _request(2)
+        # Concurrent callers sleep in parallel until their own slots.
+        await asyncio.gather(_request(1), _request(1))
+
+    asyncio.run(_run())
+    # Two slots (0.1 s) after the pair, then one interval (0.05 s) later.
+    assert granted[1] - granted[0] == pytest.approx(0.1, abs=0.03)
+    assert granted[2] - granted[1] == pytest.approx(0.05, abs=0.03)
+
+
+def test_clients_on_different_event_loops_get_separate_limiters():
+    async def _open():
+        return PubMedClient(base_url="https://example.test")
+
+    first = asyncio.run(_open())
+    second = asyncio.run(_open())
+    try:
+        assert first._rate_limiter is not second._rate_limiter
+    finally:
+        asyncio.run(first.aclose())
+        asyncio.run(second.aclose())
+    assert PubMedClient._limiters == {}
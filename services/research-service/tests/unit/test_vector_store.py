@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from research_service import vector_store
+from research_service.vector_store import CacheStore
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(vector_store, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_full_store_evicts_least_recently_used_entry():
+    store: CacheStore[str] = CacheStore(ttl_seconds=60, maxsize=2)
+    store.set("a", "A")
+    store.set("b", "B")
+    assert store.get("a") == "A"
+    store.set("c", "C")
+
+    assert store.get("b") is None
+    assert store.get("a") == "A"
+    assert store.get("c") == "C"
+
+
+def test_expired_entries_are_swept_without_being_read(clock):
+    store: CacheStore[str] = CacheStore(ttl_seconds=10)
+    store.set("a", "A")
+    store.set("b", "B")
+    clock[0] = 11.0
+    store.set("c", "C")
+
+    assert store.size() == 1
+    assert store.get("c") == "C"
+
+
+def test_overwritten_entry_survives_its_stale_expiry(clock):
+    store: CacheStore[str] = CacheStore(ttl_seconds=10)
+    store.set("a", "old")
+    clock[0] = 5.0
+    store.set("a", "new")
+    clock[0] = 11.0
+    store.set("b", "B")
+
+    assert store.get("a") == "new"
+    clock[0] = 16.0
+    store.set("c", "C")
+    assert store.get("a") is None
+
+
+def test_get_or_create_does_not_cache_failures():
+    store: CacheStore[str] = CacheStore(ttl_seconds=60)
+    calls: list[int] = []
+
+    async def _factory():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("upstream down")
+        return "value"
+
+    async def _run():
+        with pytest.raises(RuntimeError):
+            await store.get_or_create("key", _factory)
+        return await store.get_or_create("key", _factory)
+
+    assert asyncio.run(_run()) == "value"
+    assert len(calls) == 2
+    assert store.get("key") == "value"
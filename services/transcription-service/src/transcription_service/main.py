@@ -12,18 +12,31 @@ from .errors import TranscriptFetchError
 from .observability import configure_logging, metrics_response, observability_middleware
 from .schemas import HealthResponse, TranscriptionRequest, TranscriptionResponse
 from .youtube_client import YouTubeClient
-from .yt_dlp_runner import ProcessYtDlpRunner
+from .yt_dlp_runner import (
+    CachingYtDlpRunner,
+    InProcessYtDlpRunner,
+    ProcessYtDlpRunner,
+    YtDlpRunner,
+)
 
 
 MAX_TRANSCRIPT_CHARS = int(os.getenv("TRANSCRIPTION_MAX_CHARS", "120000"))
+YTDLP_CACHE_TTL_SECONDS = int(os.getenv("YTDLP_CACHE_TTL_SECONDS", "900"))
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    yt_dlp_bin = os.getenv("YTDLP_BIN", "yt-dlp")
-    logger.info("Initializing YouTube client with yt-dlp bin=%s", yt_dlp_bin)
-    runner = ProcessYtDlpRunner(binary=yt_dlp_bin)
+    yt_dlp_bin = os.getenv("YTDLP_BIN")
+    runner: YtDlpRunner
+    if yt_dlp_bin:
+        logger.info("Initializing YouTube client with yt-dlp bin=%s", yt_dlp_bin)
+        runner = ProcessYtDlpRunner(binary=yt_dlp_bin)
+    else:
+        logger.info("Initializing YouTube client with in-process yt-dlp")
+        runner = InProcessYtDlpRunner()
+    if YTDLP_CACHE_TTL_SECONDS > 0:
+        runner = CachingYtDlpRunner(runner, ttl_seconds=YTDLP_CACHE_TTL_SECONDS)
     app.state.youtube_client = YouTubeClient(runner=runner)
     yield
 
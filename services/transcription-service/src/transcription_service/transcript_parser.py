@@ -1,19 +1,29 @@
 from __future__ import annotations
 
 import html
+import itertools
 import re
-from typing import List
+from typing import List, Tuple
 
 from .schemas import TranscriptSegment
 
 _TIME_RE = re.compile(r"\d{1,2}:\d{2}(?::\d{2})?[\.,]\d{3}")
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"[\w\-']+")
+_LEAD_NONWORD_RE = re.compile(r"^[^\w]+")
+# One whitespace-delimited [HH:]MM:SS[.mmm] token, optionally preceded by
+# whitespace; anything else falls back to the generic timestamp parser.
+_TIMESTAMP_RE = re.compile(r"\s*(?:(\d+):)?(\d+):(\d+)(?:[.,](\d+))?(?!\S)")
+_MAX_OVERLAP_WORDS = 12
+# Cues are merged against this many chars at each end of the transcript
+# built so far instead of the whole, ever-growing string.
+_MERGE_WINDOW = 512
 
 
 def parse_captions(content: str, ext: str | None = None) -> List[TranscriptSegment]:
     if not content:
         return []
-    cleaned = _strip_header(content)
-    segments = _parse_cues(cleaned)
+    segments = _parse_cues(content)
     if segments:
         return _dedupe_segments(segments)
     if ext and ext.lower() not in {"vtt", "srt"}:
@@ -24,162 +34,224 @@ def parse_captions(content: str, ext: str | None = None) -> List[TranscriptSegme
 def build_transcript(segments: List[TranscriptSegment]) -> str:
     if not segments:
         return ""
-    cleaned_segments = _dedupe_segments(segments)
-    merged: List[str] = []
-    for segment in cleaned_segments:
-        if not segment.text:
+    # The transcript only ever grows at its end, so it is kept as a list of
+    # parts plus copies of its first and last _MERGE_WINDOW chars, which is
+    # all a merge looks at. That keeps building linear in the number of cues.
+    parts: List[str] = []
+    head = tail = ""
+    length = 0
+    # Word tokens computed while deduping are reused for the merge; stripping
+    # the text does not change them.
+    for segment, tokens in _dedupe_tokenized(segments):
+        text = segment.text.strip()
+        if not text:
             continue
-        if not merged:
-            merged.append(segment.text)
+        addition = None
+        if length > _MERGE_WINDOW and len(text) < _MERGE_WINDOW:
+            addition = _merge_window_suffix(head, tail, text, tokens)
+        if addition is None:
+            merged = _merge_overlap("".join(parts), text, tokens)
+            parts = [merged]
+            length = len(merged)
+            head = merged[:_MERGE_WINDOW]
+            tail = merged[-_MERGE_WINDOW:]
             continue
-        merged[-1] = _merge_overlap(merged[-1], segment.text)
-    return " ".join(merged).strip()
-
-
-def _strip_header(content: str) -> str:
-    lines = content.splitlines()
-    if lines and lines[0].strip().upper().startswith("WEBVTT"):
-        lines = lines[1:]
-    return "\n".join(lines)
+        if addition:
+            parts.append(addition)
+            length += len(addition)
+            tail = (tail + addition)[-_MERGE_WINDOW:]
+    return "".join(parts).strip()
 
 
 def _parse_cues(content: str) -> List[TranscriptSegment]:
-    lines = [line.rstrip("\n") for line in content.splitlines()]
+    # Single pass over the lines: a shared iterator lets each cue consume its
+    # own text lines, so nothing is re-joined, re-split or stripped twice.
+    lines = iter(content.splitlines())
+    first = next(lines, None)
+    if first is None:
+        return []
     segments: List[TranscriptSegment] = []
-    index = 0
+    if not first.strip().upper().startswith("WEBVTT"):
+        lines = itertools.chain((first,), lines)
 
-    while index < len(lines):
-        line = lines[index].strip()
-        if not line:
-            index += 1
-            continue
-        if line.isdigit():
-            index += 1
-            continue
-        if "-->" in line and _TIME_RE.search(line):
-            start, end = _parse_time_range(line)
-            index += 1
-            text_lines: List[str] = []
-            while index < len(lines) and lines[index].strip():
-                text_lines.append(lines[index].strip())
-                index += 1
-            text = _normalize_text(" ".join(text_lines))
-            if text:
-                segments.append(TranscriptSegment(start=start, end=end, text=text))
+    for raw in lines:
+        line = raw.strip()
+        if "-->" not in line or not _TIME_RE.search(line):
             continue
-        index += 1
+        start, end = _parse_time_range(line)
+        text_lines: List[str] = []
+        for raw_text in lines:
+            text_line = raw_text.strip()
+            if not text_line:
+                break
+            text_lines.append(text_line)
+        text = _normalize_text(" ".join(text_lines))
+        if text:
+            segments.append(TranscriptSegment(start=start, end=end, text=text))
 
     return segments
 
 
 def _dedupe_segments(segments: List[TranscriptSegment]) -> List[TranscriptSegment]:
-    if not segments:
-        return []
-    cleaned: List[TranscriptSegment] = []
+    return [segment for segment, _ in _dedupe_tokenized(segments)]
+
+
+def _dedupe_tokenized(
+    segments: List[TranscriptSegment],
+) -> List[Tuple[TranscriptSegment, List[str] | None]]:
+    # Each kept segment is paired with its word tokens, or None if they were
+    # never needed, so each text is tokenized at most once: as the right side
+    # of a comparison, then reused as the left side and by build_transcript.
+    cleaned: List[Tuple[TranscriptSegment, List[str] | None]] = []
     for segment in segments:
         if not segment.text:
             continue
         if not cleaned:
-            cleaned.append(segment)
+            cleaned.append((segment, None))
             continue
-        prev = cleaned[-1]
+        prev, prev_tokens = cleaned[-1]
         if segment.text == prev.text:
             continue
         if segment.text.startswith(prev.text):
-            cleaned[-1] = segment
+            cleaned[-1] = (segment, None)
             continue
         if prev.text.startswith(segment.text):
             continue
-        overlap_words = _word_overlap_count(prev.text, segment.text)
+        if prev_tokens is None:
+            prev_tokens = _tokenize_words(prev.text)
+            cleaned[-1] = (prev, prev_tokens)
+        tokens = _tokenize_words(segment.text)
+        overlap_words = _word_overlap_count(prev_tokens, tokens)
         if overlap_words >= 2:
             trimmed = _strip_leading_words(segment.text, overlap_words)
             if not trimmed:
                 continue
-            cleaned.append(TranscriptSegment(start=segment.start, end=segment.end, text=trimmed))
+            cleaned.append(
+                (TranscriptSegment(start=segment.start, end=segment.end, text=trimmed), None)
+            )
             continue
-        cleaned.append(segment)
+        cleaned.append((segment, tokens))
     return cleaned
 
 
-def _merge_overlap(left: str, right: str) -> str:
+def _merge_overlap(left: str, right: str, right_tokens: List[str] | None = None) -> str:
     left = left.strip()
     right = right.strip()
     if not left:
         return right
     if not right:
         return left
-    if right.startswith(left):
-        return right
-    if left.startswith(right):
-        return left
-    merged = _merge_char_overlap(left, right)
-    if merged != f"{left} {right}":
-        return merged
-    return _merge_word_overlap(left, right)
-
-
-def _merge_char_overlap(left: str, right: str) -> str:
-    max_len = min(len(left), len(right))
-    overlap = 0
-    for size in range(1, max_len + 1):
-        if left[-size:] == right[:size]:
-            overlap = size
+    # Consecutive cues rarely share a first char, so one comparison usually
+    # rules out both prefix checks.
+    if left[0] == right[0]:
+        if right.startswith(left):
+            return right
+        if left.startswith(right):
+            return left
+    overlap = _char_overlap_count(left, right)
     if overlap:
         return f"{left}{right[overlap:]}"
-    return f"{left} {right}"
+    return f"{left}{_word_overlap_suffix(_tokenize_words(left), right, right_tokens)}"
 
 
-def _merge_word_overlap(left: str, right: str) -> str:
-    left_tokens = _tokenize_words(left)
-    right_tokens = _tokenize_words(right)
+def _merge_window_suffix(
+    head: str, tail: str, right: str, right_tokens: List[str] | None = None
+) -> str | None:
+    # Same result as _merge_overlap for a stripped transcript longer than
+    # _MERGE_WINDOW and a shorter stripped right, expressed as the text to
+    # append. Returns None when the window cannot decide the word overlap.
+    if head[0] == right[0] and head.startswith(right):
+        return ""
+    overlap = _char_overlap_count(tail, right)
+    if overlap:
+        return right[overlap:]
+    tail_tokens = _tokenize_words(tail)
+    if len(tail_tokens) <= _MAX_OVERLAP_WORDS:
+        return None
+    # The window edge may cut the first token; the ones after it are whole.
+    return _word_overlap_suffix(tail_tokens[1:], right, right_tokens)
+
+
+def _char_overlap_count(left: str, right: str) -> int:
+    # Longest suffix of left that is a prefix of right. Every candidate suffix
+    # starts with right[0], so str.find jumps between candidates from the
+    # longest down and the first hit is the answer, instead of comparing a
+    # slice for every possible size.
+    max_len = min(len(left), len(right))
+    if not max_len:
+        return 0
+    first = right[0]
+    index = left.find(first, len(left) - max_len)
+    while index != -1:
+        if right.startswith(left[index:]):
+            return len(left) - index
+        index = left.find(first, index + 1)
+    return 0
+
+
+def _word_overlap_suffix(
+    left_tokens: List[str], right: str, right_tokens: List[str] | None = None
+) -> str:
+    if right_tokens is None:
+        right_tokens = _tokenize_words(right)
     if not left_tokens or not right_tokens:
-        return f"{left} {right}"
-    overlap = _word_overlap_count(left, right)
+        return f" {right}"
+    overlap = _word_overlap_count(left_tokens, right_tokens)
     if overlap >= 2:
         trimmed_right = " ".join(right_tokens[overlap:])
-        return f"{left} {trimmed_right}".strip()
-    return f"{left} {right}"
+        return f" {trimmed_right}" if trimmed_right else ""
+    return f" {right}"
 
 
 def _tokenize_words(text: str) -> List[str]:
-    return re.findall(r"[\w\-']+", text.lower())
+    return _WORD_RE.findall(text.lower())
 
 
-def _word_overlap_count(left: str, right: str) -> int:
-    left_tokens = _tokenize_words(left)
-    right_tokens = _tokenize_words(right)
+def _word_overlap_count(left_tokens: List[str], right_tokens: List[str]) -> int:
     if not left_tokens or not right_tokens:
         return 0
-    max_len = min(len(left_tokens), len(right_tokens), 12)
-    overlap = 0
-    for size in range(1, max_len + 1):
-        if left_tokens[-size:] == right_tokens[:size]:
-            overlap = size
-    return overlap
+    max_len = min(len(left_tokens), len(right_tokens), _MAX_OVERLAP_WORDS)
+    # Longest overlap first, and only where left has right's first word; the
+    # first full match is the largest, so stop there.
+    first = right_tokens[0]
+    end = len(left_tokens)
+    for start in range(end - max_len, end):
+        if left_tokens[start] == first and left_tokens[start:] == right_tokens[: end - start]:
+            return end - start
+    return 0
 
 
 def _strip_leading_words(text: str, count: int) -> str:
     if count <= 0:
         return text.strip()
-    last_end = 0
-    matches = list(re.finditer(r"[\w\-']+", text))
+    # Only the first count + 1 words matter: the count-th ends the overlap and
+    # one more must follow for anything to remain.
+    matches = list(itertools.islice(_WORD_RE.finditer(text), count + 1))
     if count >= len(matches):
         return ""
     last_end = matches[count - 1].end()
     trimmed = text[last_end:]
-    trimmed = re.sub(r"^[^\w]+", "", trimmed)
+    trimmed = _LEAD_NONWORD_RE.sub("", trimmed)
     return trimmed.strip()
 
 
 def _parse_time_range(line: str) -> tuple[float, float]:
     start_raw, end_raw = line.split("-->", 1)
-    start = _parse_timestamp(start_raw.strip())
-    end_part = end_raw.strip().split()[0]
-    end = _parse_timestamp(end_part)
+    start = _parse_timestamp(start_raw)
+    # The end timestamp may be followed by cue settings; matching it in place
+    # avoids splitting the rest of the line.
+    match = _TIMESTAMP_RE.match(end_raw)
+    if match:
+        end = _timestamp_seconds(match)
+    else:
+        end = _parse_timestamp(end_raw.strip().split()[0])
     return start, end
 
 
 def _parse_timestamp(value: str) -> float:
+    match = _TIMESTAMP_RE.fullmatch(value.strip())
+    if match:
+        return _timestamp_seconds(match)
     value = value.strip().replace(",", ".")
     parts = value.split(":")
     if len(parts) == 3:
@@ -199,10 +271,25 @@ def _parse_timestamp(value: str) -> float:
     return hours * 3600 + minutes * 60 + seconds + (millis / 1000)
 
 
+def _timestamp_seconds(match: re.Match[str]) -> float:
+    hours, minutes, seconds, millis = match.groups()
+    return (
+        int(hours or 0) * 3600
+        + int(minutes) * 60
+        + int(seconds)
+        + (int(millis[:3].ljust(3, "0")) if millis else 0) / 1000
+    )
+
+
 def _normalize_text(value: str) -> str:
     if not value:
         return ""
-    value = html.unescape(value)
-    value = re.sub(r"<[^>]+>", "", value)
-    value = re.sub(r"\s+", " ", value)
-    return value.strip()
+    # Most cue text has neither entities nor tags; the membership checks are
+    # far cheaper than running unescape or the tag regex over every cue.
+    if "&" in value:
+        value = html.unescape(value)
+    if "<" in value:
+        value = _TAG_RE.sub("", value)
+    # str.split() collapses the same whitespace set as \s+ and drops it at
+    # both ends, without going through the regex engine.
+    return " ".join(value.split())
@@ -10,6 +10,8 @@ from .schemas import TranscriptSegment, VideoMetadata
 from .transcript_parser import build_transcript, parse_captions
 from .yt_dlp_runner import YtDlpRunner
 
+_PREFERRED_EXTS = ("vtt", "srt", "ttml", "srv3", "json3")
+
 
 @dataclass(frozen=True)
 class TranscriptResult:
@@ -43,7 +45,11 @@ class YouTubeClient:
             choice.is_auto,
             choice.ext,
         )
-        segments = parse_captions(caption_text, choice.ext)
+        # Parsing and merging a long transcript is CPU-bound; keep it off the
+        # event loop so concurrent requests are not stalled behind it.
+        segments, transcript = await asyncio.to_thread(
+            _process_captions, caption_text, choice.ext
+        )
         if not segments:
             raise TranscriptFetchError("No usable captions found in subtitle file")
 
@@ -55,7 +61,6 @@ class YouTubeClient:
             thumbnail_url=info.get("thumbnail"),
             webpage_url=info.get("webpage_url"),
         )
-        transcript = build_transcript(segments)
 
         return TranscriptResult(
             video=video,
@@ -70,71 +75,26 @@ class YouTubeClient:
         subtitles = info.get("subtitles") or {}
         auto_captions = info.get("automatic_captions") or {}
 
-        # Prefer original audio language from metadata.
+        # One pass over both caption maps ranks every language that has
+        # tracks: the original audio language first, manual captions before
+        # automatic ones, then alphabetically by language code.
         original_language = self._video_language(info)
-        if original_language:
-            manual_choice = self._select_caption_for_language(
-                subtitles,
-                original_language,
-                is_auto=False,
-                prefer_original=True,
-            )
-            if manual_choice:
-                self._log_choice(manual_choice, info)
-                return manual_choice
-
-            auto_choice = self._select_caption_for_language(
-                auto_captions,
-                original_language,
-                is_auto=True,
-                prefer_original=True,
-            )
-            if auto_choice:
-                self._log_choice(auto_choice, info)
-                return auto_choice
-
-            manual_choice = self._select_caption_for_language(
-                subtitles,
-                original_language,
-                is_auto=False,
-                prefer_original=False,
-            )
-            if manual_choice:
-                self._log_choice(manual_choice, info)
-                return manual_choice
-
-            auto_choice = self._select_caption_for_language(
-                auto_captions,
-                original_language,
-                is_auto=True,
-                prefer_original=False,
-            )
-            if auto_choice:
-                self._log_choice(auto_choice, info)
-                return auto_choice
-
-        # Fallbacks when original language is missing from metadata.
-        manual_choice = self._select_caption_any(subtitles, is_auto=False, prefer_original=True)
-        if manual_choice:
-            self._log_choice(manual_choice, info)
-            return manual_choice
-
-        auto_choice = self._select_caption_any(auto_captions, is_auto=True, prefer_original=True)
-        if auto_choice:
-            self._log_choice(auto_choice, info)
-            return auto_choice
-
-        manual_choice = self._select_caption_any(subtitles, is_auto=False, prefer_original=False)
-        if manual_choice:
-            self._log_choice(manual_choice, info)
-            return manual_choice
-
-        auto_choice = self._select_caption_any(auto_captions, is_auto=True, prefer_original=False)
-        if auto_choice:
-            self._log_choice(auto_choice, info)
-            return auto_choice
-
-        raise TranscriptFetchError("No subtitles or automatic captions available")
+        best: tuple[tuple[bool, bool, str], List[Dict]] | None = None
+        for is_auto, caption_map in ((False, subtitles), (True, auto_captions)):
+            for language, entries in caption_map.items():
+                if not entries:
+                    continue
+                rank = (language != original_language, is_auto, language)
+                if best is None or rank < best[0]:
+                    best = (rank, entries)
+        if best is None:
+            raise TranscriptFetchError("No subtitles or automatic captions available")
+
+        (_, is_auto, language), entries = best
+        entry = self._pick_best_entry(entries, prefer_original=True)
+        choice = _CaptionChoice(language, entry["url"], entry["ext"], is_auto)
+        self._log_choice(choice, info)
+        return choice
 
     def _log_choice(self, choice: _CaptionChoice, info: Dict) -> None:
         logger = logging.getLogger(__name__)
@@ -146,30 +106,6 @@ class YouTubeClient:
             info.get("language"),
         )
 
-    def _select_caption_any(
-        self,
-        caption_map: Dict[str, List[Dict]],
-        is_auto: bool,
-        prefer_original: bool,
-    ) -> _CaptionChoice | None:
-        for lang in sorted(caption_map.keys()):
-            entry = self._pick_best_entry(caption_map.get(lang) or [], prefer_original)
-            if entry:
-                return _CaptionChoice(lang, entry["url"], entry["ext"], is_auto)
-        return None
-
-    def _select_caption_for_language(
-        self,
-        caption_map: Dict[str, List[Dict]],
-        language: str,
-        is_auto: bool,
-        prefer_original: bool,
-    ) -> _CaptionChoice | None:
-        entry = self._pick_best_entry(caption_map.get(language) or [], prefer_original)
-        if entry:
-            return _CaptionChoice(language, entry["url"], entry["ext"], is_auto)
-        return None
-
     def _pick_best_entry(self, entries: List[Dict], prefer_original: bool) -> Dict | None:
         if not entries:
             return None
@@ -190,9 +126,19 @@ class YouTubeClient:
     def _pick_format(self, entries: List[Dict]) -> Dict | None:
         if not entries:
             return None
-        preferred_exts = ["vtt", "srt", "ttml", "srv3", "json3"]
-        for ext in preferred_exts:
-            for entry in entries:
-                if entry.get("ext") == ext:
-                    return entry
+        # Bucket once by ext (first entry wins), then look up in rank order.
+        by_ext: Dict[str, Dict] = {}
+        for entry in entries:
+            by_ext.setdefault(entry.get("ext"), entry)
+        for ext in _PREFERRED_EXTS:
+            entry = by_ext.get(ext)
+            if entry is not None:
+                return entry
         return entries[0]
+
+
+def _process_captions(caption_text: str, ext: str) -> tuple[List[TranscriptSegment], str]:
+    segments = parse_captions(caption_text, ext)
+    if not segments:
+        return segments, ""
+    return segments, build_transcript(segments)
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
-import json
 import os
+import re
 import subprocess
 import tempfile
-from glob import glob
+import threading
+from collections import OrderedDict
 from typing import Dict, Protocol
 
+import orjson
+from cachetools import TTLCache
+from yt_dlp import YoutubeDL
+from yt_dlp.utils import YoutubeDLError
+
 from .errors import TranscriptFetchError
 
+# Only the video itself is needed: ignore the list a watch URL belongs to, and
+# resolve a bare playlist URL to its first item instead of every entry.
+_SINGLE_VIDEO_ARGS = ("--no-playlist", "--playlist-items", "1")
+_SHM_DIR = "/dev/shm"
+_VIDEO_ID_RE = re.compile(r"(?:[?&]v=|youtu\.be/|/shorts/|/embed/|/live/)([A-Za-z0-9_-]{11})")
+
 
 class YtDlpRunner(Protocol):
     def extract_info(self, url: str) -> Dict:
@@ -21,16 +33,20 @@ class YtDlpRunner(Protocol):
 class ProcessYtDlpRunner:
     def __init__(self, binary: str = "yt-dlp") -> None:
         self._binary = binary
+        self._tmp_root = _memory_tmp_root()
 
     def extract_info(self, url: str) -> Dict:
-        result = self._run(["-J", "--skip-download", url])
+        result = self._run(["-J", "--skip-download", *_SINGLE_VIDEO_ARGS, url])
+        # -J output lists every format and can run to megabytes; orjson
+        # parses it several times faster than the json module.
         try:
-            return json.loads(result)
-        except json.JSONDecodeError as exc:
+            info = orjson.loads(result)
+        except orjson.JSONDecodeError as exc:
             raise TranscriptFetchError("yt-dlp returned invalid JSON") from exc
+        return _first_video(info)
 
     def download_caption(self, url: str, language: str, is_auto: bool, ext: str) -> str:
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with tempfile.TemporaryDirectory(dir=self._tmp_root) as tmpdir:
             output_template = os.path.join(tmpdir, "%(id)s.%(ext)s")
             args = [
                 "--skip-download",
@@ -40,6 +56,7 @@ class ProcessYtDlpRunner:
                 ext,
                 "-o",
                 output_template,
+                *_SINGLE_VIDEO_ARGS,
             ]
             if is_auto:
                 args.append("--write-auto-sub")
@@ -48,31 +65,175 @@ class ProcessYtDlpRunner:
             args.append(url)
             self._run(args)
 
-            pattern = os.path.join(tmpdir, f"*.{language}.{ext}")
-            matches = sorted(glob(pattern))
-            if not matches:
-                fallback = sorted(glob(os.path.join(tmpdir, f"*.{language}.*")))
-                matches = fallback
+            # One directory pass: prefer <id>.<language>.<ext>, otherwise any
+            # other format written for the language; the last name wins.
+            suffix = f".{language}.{ext}"
+            marker = f".{language}."
+            primary: list[str] = []
+            fallback: list[str] = []
+            with os.scandir(tmpdir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    if name.endswith(suffix):
+                        primary.append(entry.path)
+                    elif marker in name:
+                        fallback.append(entry.path)
+            matches = primary or fallback
             if not matches:
                 raise TranscriptFetchError("yt-dlp did not download subtitle file")
 
-            subtitle_path = matches[-1]
+            subtitle_path = max(matches)
             with open(subtitle_path, "r", encoding="utf-8") as handle:
                 return handle.read()
 
-    def _run(self, args: list[str]) -> str:
+    def _run(self, args: list[str]) -> bytes:
+        # Raw stdout goes straight to orjson; only stderr is decoded, and
+        # only when the command fails.
         command = [self._binary, *args]
         try:
             completed = subprocess.run(
                 command,
                 check=True,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
             )
         except FileNotFoundError as exc:
             raise TranscriptFetchError("yt-dlp binary not found") from exc
         except subprocess.CalledProcessError as exc:
-            stderr = (exc.stderr or "").strip()
+            stderr = (exc.stderr or b"").decode("utf-8", "replace").strip()
             message = stderr or "yt-dlp command failed"
             raise TranscriptFetchError(message) from exc
         return completed.stdout
+
+
+class InProcessYtDlpRunner:
+    """Runs yt-dlp as a library so extractors are loaded once per process.
+
+    ``YoutubeDL`` instances are not safe to share between threads, so each
+    worker thread used by ``asyncio.to_thread`` keeps its own.
+    """
+
+    _OPTIONS = {
+        "quiet": True,
+        "no_warnings": True,
+        "skip_download": True,
+        "noplaylist": True,
+        "playlist_items": "1",
+    }
+
+    _PENDING_INFO_LIMIT = 32
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        # Metadata from extract_info waiting for the download_caption call
+        # that normally follows it for the same URL. The caption URLs are
+        # already in it, so the download does not probe the video again.
+        self._pending_info: OrderedDict[str, Dict] = OrderedDict()
+        self._pending_lock = threading.Lock()
+
+    def extract_info(self, url: str) -> Dict:
+        try:
+            info = self._ydl().extract_info(url, download=False)
+        except YoutubeDLError as exc:
+            raise TranscriptFetchError(str(exc)) from exc
+        info = _first_video(info)
+        with self._pending_lock:
+            self._pending_info[url] = info
+            self._pending_info.move_to_end(url)
+            while len(self._pending_info) > self._PENDING_INFO_LIMIT:
+                self._pending_info.popitem(last=False)
+        return info
+
+    def download_caption(self, url: str, language: str, is_auto: bool, ext: str) -> str:
+        # Each entry is used once, so signed caption URLs never go stale here.
+        with self._pending_lock:
+            info = self._pending_info.pop(url, None)
+        if info is None:
+            info = self.extract_info(url)
+            with self._pending_lock:
+                self._pending_info.pop(url, None)
+        caption_map = info.get("automatic_captions" if is_auto else "subtitles") or {}
+        entries = caption_map.get(language) or []
+        entry = next((item for item in entries if item.get("ext") == ext), None)
+        if entry is None or not entry.get("url"):
+            raise TranscriptFetchError("yt-dlp did not download subtitle file")
+        try:
+            with self._ydl().urlopen(entry["url"]) as response:
+                return response.read().decode("utf-8")
+        except (YoutubeDLError, OSError) as exc:
+            raise TranscriptFetchError(f"Failed to download subtitles: {exc}") from exc
+
+    def _ydl(self) -> YoutubeDL:
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is None:
+            ydl = YoutubeDL(dict(self._OPTIONS))
+            self._local.ydl = ydl
+        return ydl
+
+
+class CachingYtDlpRunner:
+    """Caches another runner's results by YouTube video ID for a short TTL.
+
+    Different URL forms of the same video (watch, youtu.be, shorts) share an
+    entry, so retries and repeated requests skip the metadata probe and the
+    subtitle download. Calls arrive on ``asyncio.to_thread`` workers, hence
+    the lock around the caches.
+    """
+
+    def __init__(self, runner: YtDlpRunner, ttl_seconds: int = 900, maxsize: int = 1024) -> None:
+        self._runner = runner
+        self._info: TTLCache[str, Dict] = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        self._captions: TTLCache[tuple[str, str, bool, str], str] = TTLCache(
+            maxsize=maxsize, ttl=ttl_seconds
+        )
+        self._lock = threading.Lock()
+
+    def extract_info(self, url: str) -> Dict:
+        key = _video_key(url)
+        with self._lock:
+            info = self._info.get(key)
+        if info is None:
+            info = self._runner.extract_info(url)
+            with self._lock:
+                self._info[key] = info
+        return info
+
+    def download_caption(self, url: str, language: str, is_auto: bool, ext: str) -> str:
+        key = (_video_key(url), language, is_auto, ext)
+        with self._lock:
+            caption = self._captions.get(key)
+        if caption is None:
+            caption = self._runner.download_caption(url, language, is_auto, ext)
+            with self._lock:
+                self._captions[key] = caption
+        return caption
+
+
+def _memory_tmp_root() -> str | None:
+    # Subtitle files live only for the duration of one call; keeping them on
+    # tmpfs avoids disk writes. None falls back to the default temp dir.
+    if not os.path.isdir(_SHM_DIR) or not os.access(_SHM_DIR, os.W_OK):
+        return None
+    root = os.path.join(_SHM_DIR, "yt-dlp-captions")
+    try:
+        os.makedirs(root, exist_ok=True)
+    except OSError:
+        return None
+    return root
+
+
+def _video_key(url: str) -> str:
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else url.strip()
+
+
+def _first_video(info: Dict | None) -> Dict:
+    # Playlist URLs still come back wrapped, with the selected item in entries.
+    if info and info.get("_type") == "playlist":
+        entries = [entry for entry in info.get("entries") or [] if entry]
+        info = entries[0] if entries else None
+    if not info:
+        raise TranscriptFetchError("yt-dlp returned no video metadata")
+    return info
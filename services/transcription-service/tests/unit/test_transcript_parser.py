@@ -60,3 +60,13 @@ refined carbs and focus on protein
     assert len(segments) == 2
     assert segments[0].text == "We should avoid sugar and refined carbs"
     assert segments[1].text == "and focus on protein"
+
+
+def test_build_transcript_merges_overlap_past_long_prefix() -> None:
+    words = [f"word{index}" for index in range(400)]
+    cues = []
+    for number, start in enumerate(range(0, len(words), 5), start=1):
+        text = " ".join(words[max(0, start - 3) : start + 5])
+        cues.append(f"{number}\n00:00:{number % 60:02d},000 --> 00:00:{number % 60:02d},500\n{text}\n")
+    segments = parse_captions("\n".join(cues), "srt")
+    assert build_transcript(segments) == " ".join(words)
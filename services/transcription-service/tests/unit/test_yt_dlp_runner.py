@@ -0,0 +1,30 @@
+from transcription_service.yt_dlp_runner import CachingYtDlpRunner
+
+
+class _CountingRunner:
+    def __init__(self) -> None:
+        self.info_calls = 0
+        self.caption_calls = 0
+
+    def extract_info(self, url: str) -> dict:
+        self.info_calls += 1
+        return {"id": "dQw4w9WgXcQ", "webpage_url": url}
+
+    def download_caption(self, url: str, language: str, is_auto: bool, ext: str) -> str:
+        self.caption_calls += 1
+        return f"WEBVTT {language} {ext}"
+
+
+def test_caching_runner_shares_entries_across_url_forms() -> None:
+    inner = _CountingRunner()
+    runner = CachingYtDlpRunner(inner, ttl_seconds=60)
+
+    first = runner.extract_info("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+    second = runner.extract_info("https://youtu.be/dQw4w9WgXcQ?t=10")
+    assert first is second
+    assert inner.info_calls == 1
+
+    runner.download_caption("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "en", False, "vtt")
+    runner.download_caption("https://www.youtube.com/shorts/dQw4w9WgXcQ", "en", False, "vtt")
+    runner.download_caption("https://youtu.be/dQw4w9WgXcQ", "en", True, "vtt")
+    assert inner.caption_calls == 2
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import List
 
 from pydantic import BaseModel, Field
 
@@ -16,11 +15,11 @@ class ResearchSource(BaseModel):
     url: str
     source_type: str
     publication_date: date | None = None
-    publication_type: List[str] | None = None
+    publication_type: list[str] | None = None
     relevance_score: float = 0.0
     snippet: str | None = None
 
 
 class ResearchResults(BaseModel):
     query: str
-    results: List[ResearchSource]
+    results: list[ResearchSource]